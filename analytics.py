@@ -0,0 +1,53 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from data import load_transactions_slim, load_clients, load_recurring
+
+# Aggregations are cached per (file_path, mtime) like the loaders, so sibling
+# pages reuse the same result until the underlying file changes.
+
+@st.cache_data(show_spinner=False)
+def monthly_pivot(file_path, mtime=None):
+    """Monthly Income/Expense/Profit totals indexed by 'YYYY-MM'"""
+    transactions = load_transactions_slim(file_path, mtime)
+    # Group on numpy month buckets in a single pass instead of building a PeriodIndex
+    months = transactions['Date'].values.astype('datetime64[M]')
+    monthly = transactions.groupby([months, 'Type'], observed=True)['Amount'].sum().unstack(fill_value=0)
+    monthly = monthly.reindex(columns=['Income', 'Expense'], fill_value=0)
+    monthly['Profit'] = monthly['Income'] - monthly['Expense']
+    # String index for JSON serialization
+    monthly.index = pd.Index(np.datetime_as_string(monthly.index.values, unit='M'), name='Date')
+    return monthly
+
+@st.cache_data(show_spinner=False)
+def expense_by_category(file_path, mtime=None):
+    """Total expenses per category, largest first"""
+    transactions = load_transactions_slim(file_path, mtime)
+    expenses = transactions[transactions['Type'] == 'Expense']
+    return expenses.groupby('Category', observed=True, sort=False)['Amount'].sum().sort_values(ascending=False)
+
+@st.cache_data(show_spinner=False)
+def income_by_source(file_path, mtime=None):
+    """Total income per category, largest first"""
+    transactions = load_transactions_slim(file_path, mtime)
+    income = transactions[transactions['Type'] == 'Income']
+    return income.groupby('Category', observed=True, sort=False)['Amount'].sum().sort_values(ascending=False)
+
+@st.cache_data(show_spinner=False)
+def client_status_summary(file_path, mtime=None):
+    """Invoice count and total amount per status"""
+    clients = load_clients(file_path, mtime)
+    return clients.groupby('Status', observed=True)['Amount'].agg(sum='sum', count='size')
+
+@st.cache_data(show_spinner=False)
+def paid_income_by_client(file_path, mtime=None):
+    """Total paid invoice amount per client, largest first"""
+    clients = load_clients(file_path, mtime)
+    paid = clients[clients['Status'] == 'Paid']
+    return paid.groupby('Client', sort=False)['Amount'].sum().sort_values(ascending=False)
+
+@st.cache_data(show_spinner=False)
+def recurring_by_frequency(file_path, mtime=None):
+    """Total recurring amount per billing frequency"""
+    recurring = load_recurring(file_path, mtime)
+    return recurring.groupby('Frequency', observed=True)['Amount'].sum()
@@ -1,12 +1,13 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import numpy as np
-import os
 import sqlite3
 from database import get_user_data_path, verify_user, create_user
+from data import (file_mtime, init_data_files, load_transactions_slim,
+                  load_clients, load_recurring, append_rows)
+from analytics import (monthly_pivot, expense_by_category, income_by_source,
+                       client_status_summary, paid_income_by_client, recurring_by_frequency)
 
 # Page configuration
 st.set_page_config(
@@ -56,50 +57,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Data loading functions
-def load_transactions(file_path):
-    """Load transactions data"""
-    try:
-        if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
-            # Return empty DataFrame with expected columns
-            return pd.DataFrame(columns=['Date', 'Type', 'Category', 'Amount', 'Description'])
-            
-        df = pd.read_csv(file_path)
-        df['Date'] = pd.to_datetime(df['Date'], format='mixed', errors='coerce')
-        return df
-    except (FileNotFoundError, pd.errors.EmptyDataError, pd.errors.ParserError, ValueError) as e:
-        st.warning(f"Error loading transactions data: {e}")
-        return pd.DataFrame(columns=['Date', 'Type', 'Category', 'Amount', 'Description'])
-
-def load_clients(file_path):
-    """Load clients data"""
-    try:
-        if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
-            # Return empty DataFrame with expected columns
-            return pd.DataFrame(columns=['Client', 'Project', 'Amount', 'Invoice_Sent', 'Due_Date', 'Status'])
-            
-        df = pd.read_csv(file_path)
-        # Parse dates robustly: accept ISO8601 and plain YYYY-MM-DD strings
-        df['Invoice_Sent'] = pd.to_datetime(df['Invoice_Sent'], format='mixed', errors='coerce')
-        df['Due_Date'] = pd.to_datetime(df['Due_Date'], format='mixed', errors='coerce')
-        return df
-    except (FileNotFoundError, pd.errors.EmptyDataError, pd.errors.ParserError, ValueError) as e:
-        st.warning(f"Error loading clients data: {e}")
-        return pd.DataFrame(columns=['Client', 'Project', 'Amount', 'Invoice_Sent', 'Due_Date', 'Status'])
-
-def load_recurring(file_path):
-    """Load recurring expenses data"""
-    try:
-        if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
-            # Return empty DataFrame with expected columns
-            return pd.DataFrame(columns=['Vendor', 'Frequency', 'Amount', 'Due_Month', 'Notes'])
-            
-        return pd.read_csv(file_path)
-    except (FileNotFoundError, pd.errors.EmptyDataError, pd.errors.ParserError) as e:
-        st.warning(f"Error loading recurring expenses data: {e}")
-        return pd.DataFrame(columns=['Vendor', 'Frequency', 'Amount', 'Due_Month', 'Notes'])
-
-
 # Authentication functions
 def show_login():
     st.title("🔑 Login")
@@ -176,16 +133,8 @@ def show_dashboard():
     clients_file = get_user_data_path(st.session_state.user, "clients.csv")
     recurring_file = get_user_data_path(st.session_state.user, "recurring.csv")
     
-    # Initialize data files if they don't exist
-    if not os.path.exists(transactions_file):
-        with open(transactions_file, 'w') as f:
-            f.write("Date,Type,Category,Amount,Description\n")
-    if not os.path.exists(clients_file):
-        with open(clients_file, 'w') as f:
-            f.write("Client,Project,Amount,Invoice_Sent,Due_Date,Status\n")
-    if not os.path.exists(recurring_file):
-        with open(recurring_file, 'w') as f:
-            f.write("Vendor,Frequency,Amount,Due_Month,Notes\n")
+    # Initialize data files if they don't exist (once per process)
+    init_data_files(transactions_file, clients_file, recurring_file)
     
     # Sidebar for navigation
     with st.sidebar:
@@ -255,6 +204,32 @@ def show_navigation():
     # Add some spacing
     st.markdown("---")
 
+@st.cache_resource(show_spinner=False, max_entries=8)
+def load_page_module(name, path, mtime=None):
+    """Import a page script from pages/, once per version of the file"""
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def page_route(name, path):
+    """Route that imports its page script on first visit and after each edit"""
+    def show():
+        load_page_module(name, path, file_mtime(path)).show()
+    return show
+
+# Page dispatch table; the static pages are imported lazily, so an error in
+# one of them only affects its own route
+PAGES = {
+    'home': show_home,
+    'login': show_login,
+    'register': show_register,
+    'dashboard': show_dashboard,
+    'about': page_route("about_page", "pages/about_us.py"),
+    'contact': page_route("contact_page", "pages/3_📞_Contact_Us.py"),
+}
+
 # Main app routing
 def main():
     # Custom CSS for better styling
@@ -302,56 +277,30 @@ def main():
         show_navigation()
     
     # Page routing
-    if st.session_state.page == 'home':
-        show_home()
-    elif st.session_state.page == 'login':
-        show_login()
-    elif st.session_state.page == 'register':
-        show_register()
-    elif st.session_state.page == 'dashboard':
-        show_dashboard()
-    elif st.session_state.page == 'about':
-        # Dynamic import for the about page
-        import importlib.util
-        spec = importlib.util.spec_from_file_location(
-            "about_page", 
-            "pages/2_ℹ️_About_Us.py"
-        )
-        about_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(about_module)
-        about_module.show()
-        
-    elif st.session_state.page == 'contact':
-        # Dynamic import for the contact page
-        import importlib.util
-        spec = importlib.util.spec_from_file_location(
-            "contact_page", 
-            "pages/3_📞_Contact_Us.py"
-        )
-        contact_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(contact_module)
-        contact_module.show()
+    PAGES.get(st.session_state.page, show_home)()
 
 def show_overview(transactions_file, clients_file, recurring_file):
     """Show dashboard overview with key metrics"""
+    import plotly.express as px
     st.header("📊 Dashboard Overview")
     
     # Load data
-    transactions = load_transactions(transactions_file)
-    clients = load_clients(clients_file)
-    recurring = load_recurring(recurring_file)
+    transactions = load_transactions_slim(transactions_file, file_mtime(transactions_file))
+    clients = load_clients(clients_file, file_mtime(clients_file))
+    recurring = load_recurring(recurring_file, file_mtime(recurring_file))
     
     if transactions.empty:
         st.warning("No transaction data available. Please add some data in the Data Entry page.")
         return
     
     # Calculate key metrics
-    current_month = datetime.now().strftime('%Y-%m')
-    current_month_data = transactions[transactions['Date'].dt.to_period('M').astype(str) == current_month]
+    monthly_summary = monthly_pivot(transactions_file, file_mtime(transactions_file))
+    current_month = pd.Timestamp.now().strftime('%Y-%m')
+    current_month_totals = monthly_summary.reindex([current_month], fill_value=0).iloc[0]
     
-    monthly_income = current_month_data[current_month_data['Type'] == 'Income']['Amount'].sum()
-    monthly_expenses = current_month_data[current_month_data['Type'] == 'Expense']['Amount'].sum()
-    monthly_profit = monthly_income - monthly_expenses
+    monthly_income = current_month_totals['Income']
+    monthly_expenses = current_month_totals['Expense']
+    monthly_profit = current_month_totals['Profit']
     
     # Client metrics
     total_outstanding = clients[clients['Status'].isin(['Sent', 'Due'])]['Amount'].sum() if not clients.empty else 0
@@ -383,45 +332,38 @@ def show_overview(transactions_file, clients_file, recurring_file):
     
     with col1:
         # Monthly trend
-        monthly_summary = transactions.groupby([transactions['Date'].dt.to_period('M'), 'Type'])['Amount'].sum().unstack(fill_value=0)
         if not monthly_summary.empty:
-            # Convert Period index to string for JSON serialization
-            monthly_summary.index = monthly_summary.index.astype(str)
             fig = px.line(monthly_summary.reset_index(), x='Date', y=['Income', 'Expense'], 
-                         title="Monthly Income vs Expenses Trend")
+                         title="Monthly Income vs Expenses Trend", render_mode='webgl')
             st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Expense categories
-        expense_data = transactions[transactions['Type'] == 'Expense']
-        if not expense_data.empty:
-            category_summary = expense_data.groupby('Category')['Amount'].sum().sort_values(ascending=False)
+        category_summary = expense_by_category(transactions_file, file_mtime(transactions_file))
+        if not category_summary.empty:
             fig = px.pie(values=category_summary.values, names=category_summary.index, 
                         title="Expenses by Category")
             st.plotly_chart(fig, use_container_width=True)
 
 def show_income_expenses(transactions_file):
     """Show income vs expenses analysis"""
+    import plotly.graph_objects as go
     st.header("💸 Income vs Expenses")
     
-    transactions = load_transactions(transactions_file)
+    transactions = load_transactions_slim(transactions_file, file_mtime(transactions_file))
     
     if transactions.empty:
         st.warning("No transaction data available.")
         return
     
     # Monthly comparison chart
-    monthly_data = transactions.groupby([transactions['Date'].dt.to_period('M'), 'Type'])['Amount'].sum().unstack(fill_value=0)
-    monthly_data['Profit'] = monthly_data.get('Income', 0) - monthly_data.get('Expense', 0)
-    
-    # Convert Period index to string for JSON serialization
-    monthly_data.index = monthly_data.index.astype(str)
+    monthly_data = monthly_pivot(transactions_file, file_mtime(transactions_file))
     
     fig = go.Figure()
-    fig.add_trace(go.Bar(name='Income', x=monthly_data.index, y=monthly_data.get('Income', 0), marker_color='green'))
-    fig.add_trace(go.Bar(name='Expenses', x=monthly_data.index, y=monthly_data.get('Expense', 0), marker_color='red'))
-    fig.add_trace(go.Scatter(name='Profit', x=monthly_data.index, y=monthly_data['Profit'], 
-                            mode='lines+markers', line=dict(color='blue', width=3)))
+    fig.add_trace(go.Bar(name='Income', x=monthly_data.index, y=monthly_data['Income'], marker_color='green'))
+    fig.add_trace(go.Bar(name='Expenses', x=monthly_data.index, y=monthly_data['Expense'], marker_color='red'))
+    fig.add_trace(go.Scattergl(name='Profit', x=monthly_data.index, y=monthly_data['Profit'], 
+                              mode='lines+markers', line=dict(color='blue', width=3)))
     
     fig.update_layout(title="Monthly Income vs Expenses", xaxis_title="Month", yaxis_title="Amount ($)")
     st.plotly_chart(fig, use_container_width=True)
@@ -430,7 +372,7 @@ def show_income_expenses(transactions_file):
     st.subheader("Monthly Profit/Loss Summary")
     profit_loss_df = monthly_data.copy()
     # Avoid division by zero
-    income_values = profit_loss_df.get('Income', 0)
+    income_values = profit_loss_df['Income']
     profit_loss_df['Profit_Margin'] = np.where(
         income_values > 0, 
         (profit_loss_df['Profit'] / income_values * 100).round(2),
@@ -441,17 +383,16 @@ def show_income_expenses(transactions_file):
 
 def show_expense_categories(transactions_file):
     """Show expense categorization analysis"""
+    import plotly.express as px
     st.header("🏷️ Expense Categories")
     
-    transactions = load_transactions(transactions_file)
-    expenses = transactions[transactions['Type'] == 'Expense']
+    # Category breakdown
+    category_summary = expense_by_category(transactions_file, file_mtime(transactions_file))
     
-    if expenses.empty:
+    if category_summary.empty:
         st.warning("No expense data available.")
         return
     
-    # Category breakdown
-    category_summary = expenses.groupby('Category')['Amount'].sum().sort_values(ascending=False)
     total_expenses = category_summary.sum()
     
     col1, col2 = st.columns(2)
@@ -480,9 +421,10 @@ def show_expense_categories(transactions_file):
 
 def show_income_allocations(transactions_file):
     """Show income breakdown and allocations"""
+    import plotly.express as px
     st.header("💰 Income Allocations")
     
-    transactions = load_transactions(transactions_file)
+    transactions = load_transactions_slim(transactions_file, file_mtime(transactions_file))
     income_data = transactions[transactions['Type'] == 'Income']
     
     if income_data.empty:
@@ -540,27 +482,30 @@ def show_income_allocations(transactions_file):
     
     # Income sources breakdown
     st.subheader("Income Sources")
-    income_sources = income_data.groupby('Category')['Amount'].sum().sort_values(ascending=False)
+    income_sources = income_by_source(transactions_file, file_mtime(transactions_file))
     fig = px.bar(x=income_sources.index, y=income_sources.values, 
                 title="Income by Source")
     st.plotly_chart(fig, use_container_width=True)
 
 def show_client_tracking(clients_file):
     """Show client payment tracking"""
+    import plotly.express as px
     st.header("👥 Client Payment Tracking")
     
-    clients = load_clients(clients_file)
+    clients = load_clients(clients_file, file_mtime(clients_file))
     
     if clients.empty:
         st.warning("No client data available.")
         return
     
     # KPI counts
-    status_counts = clients['Status'].value_counts()
+    status_summary = client_status_summary(clients_file, file_mtime(clients_file))
+    # From the frame, not the summary: groupby drops invoices with a blank Status
     total_amount = clients['Amount'].sum()
-    paid_amount = clients[clients['Status'] == 'Paid']['Amount'].sum()
-    outstanding_amount = clients[clients['Status'].isin(['Sent', 'Due'])]['Amount'].sum()
-    overdue_amount = clients[clients['Status'] == 'Overdue']['Amount'].sum()
+    status_summary = status_summary.reindex(['Paid', 'Sent', 'Due', 'Overdue'], fill_value=0)
+    paid = status_summary.loc['Paid']
+    outstanding = status_summary.loc[['Sent', 'Due']].sum()
+    overdue = status_summary.loc['Overdue']
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -568,13 +513,13 @@ def show_client_tracking(clients_file):
         st.metric("Total Invoices", len(clients), f"${total_amount:,.2f}")
     
     with col2:
-        st.metric("Paid", status_counts.get('Paid', 0), f"${paid_amount:,.2f}")
+        st.metric("Paid", int(paid['count']), f"${paid['sum']:,.2f}")
     
     with col3:
-        st.metric("Outstanding", status_counts.get('Sent', 0) + status_counts.get('Due', 0), f"${outstanding_amount:,.2f}")
+        st.metric("Outstanding", int(outstanding['count']), f"${outstanding['sum']:,.2f}")
     
     with col4:
-        st.metric("Overdue", status_counts.get('Overdue', 0), f"${overdue_amount:,.2f}")
+        st.metric("Overdue", int(overdue['count']), f"${overdue['sum']:,.2f}")
     
     # Client table
     st.subheader("Invoice Tracker")
@@ -582,7 +527,7 @@ def show_client_tracking(clients_file):
     
     # Income per client chart
     st.subheader("Income per Client YTD")
-    client_income = clients[clients['Status'] == 'Paid'].groupby('Client')['Amount'].sum().sort_values(ascending=False)
+    client_income = paid_income_by_client(clients_file, file_mtime(clients_file))
     if not client_income.empty:
         fig = px.bar(x=client_income.index, y=client_income.values, 
                     title="Paid Income by Client")
@@ -590,9 +535,10 @@ def show_client_tracking(clients_file):
 
 def show_recurring_expenses(recurring_file):
     """Show recurring expense overview"""
+    import plotly.express as px
     st.header("🔄 Recurring Expenses")
     
-    recurring = load_recurring(recurring_file)
+    recurring = load_recurring(recurring_file, file_mtime(recurring_file))
     
     if recurring.empty:
         st.warning("No recurring expense data available.")
@@ -620,7 +566,7 @@ def show_recurring_expenses(recurring_file):
     
     # Frequency analysis
     st.subheader("Frequency Analysis")
-    freq_analysis = recurring.groupby('Frequency')['Amount'].sum()
+    freq_analysis = recurring_by_frequency(recurring_file, file_mtime(recurring_file))
     fig = px.pie(values=freq_analysis.values, names=freq_analysis.index, 
                 title="Recurring Expenses by Frequency")
     st.plotly_chart(fig, use_container_width=True)
@@ -629,10 +575,10 @@ def show_recurring_expenses(recurring_file):
     monthly_items = recurring[recurring['Frequency'] == 'Monthly']
     if len(monthly_items) > 0:
         st.subheader("💡 Annual Savings Suggestions")
-        for _, item in monthly_items.iterrows():
-            annual_savings = item['Amount'] * 12 * 0.1  # Assume 10% savings with annual payment
-            if annual_savings > 50:  # Only suggest if savings > $50
-                st.info(f"Consider annual payment for {item['Vendor']}: Save ~${annual_savings:.2f}/year")
+        annual_savings = monthly_items['Amount'].to_numpy() * 12 * 0.1  # Assume 10% savings with annual payment
+        worth_suggesting = annual_savings > 50  # Only suggest if savings > $50
+        for vendor, savings in zip(monthly_items['Vendor'].to_numpy()[worth_suggesting], annual_savings[worth_suggesting]):
+            st.info(f"Consider annual payment for {vendor}: Save ~${savings:.2f}/year")
 
 def show_data_entry(transactions_file, clients_file, recurring_file):
     """Show data entry forms"""
@@ -670,10 +616,11 @@ def show_data_entry(transactions_file, clients_file, recurring_file):
                         'Description': [description.strip()]
                     })
                     
-                    existing_data = load_transactions(transactions_file)
-                    updated_data = pd.concat([existing_data, new_row], ignore_index=True)
-                    updated_data.to_csv(transactions_file, index=False)
-                    st.cache_data.clear()  # Clear cache to refresh data
+                    append_rows(new_row, transactions_file)
+                    load_transactions_slim.clear()  # Clear cache to refresh data
+                    monthly_pivot.clear()
+                    expense_by_category.clear()
+                    income_by_source.clear()
                     st.success("Transaction added successfully!")
                     st.rerun()
     
@@ -710,10 +657,10 @@ def show_data_entry(transactions_file, clients_file, recurring_file):
                         'Status': [status] 
                     })
                     
-                    existing_data = load_clients(clients_file)
-                    updated_data = pd.concat([existing_data, new_row], ignore_index=True)
-                    updated_data.to_csv(clients_file, index=False)
-                    st.cache_data.clear()  # Clear cache to refresh data
+                    append_rows(new_row, clients_file)
+                    load_clients.clear()  # Clear cache to refresh data
+                    client_status_summary.clear()
+                    paid_income_by_client.clear()
                     st.success("Client added successfully!")
                     st.rerun()
     
@@ -746,10 +693,9 @@ def show_data_entry(transactions_file, clients_file, recurring_file):
                         'Notes': [notes.strip() if notes else ""]
                     })
                     
-                    existing_data = load_recurring(recurring_file)
-                    updated_data = pd.concat([existing_data, new_row], ignore_index=True)
-                    updated_data.to_csv(recurring_file, index=False)
-                    st.cache_data.clear()  # Clear cache to refresh data
+                    append_rows(new_row, recurring_file)
+                    load_recurring.clear()  # Clear cache to refresh data
+                    recurring_by_frequency.clear()
                     st.success("Recurring expense added successfully!")
                     st.rerun()
     
@@ -769,10 +715,12 @@ def show_data_entry(transactions_file, clients_file, recurring_file):
                     # Validate required columns
                     required_cols = ['Date', 'Type', 'Category', 'Amount', 'Description']
                     if all(col in df.columns for col in required_cols):
-                        existing_data = load_transactions(transactions_file)
-                        updated_data = pd.concat([existing_data, df], ignore_index=True)
-                        updated_data.to_csv(transactions_file, index=False)
-                        st.cache_data.clear()
+                        # Append in the file's column order without reloading existing rows
+                        append_rows(df[required_cols], transactions_file)
+                        load_transactions_slim.clear()
+                        monthly_pivot.clear()
+                        expense_by_category.clear()
+                        income_by_source.clear()
                         st.success(f"Successfully imported {len(df)} transactions!")
                     else:
                         st.error(f"CSV must contain columns: {', '.join(required_cols)}")
@@ -789,10 +737,11 @@ def show_data_entry(transactions_file, clients_file, recurring_file):
                     # Validate required columns
                     required_cols = ['Client', 'Project', 'Amount', 'Invoice_Sent', 'Due_Date', 'Status']
                     if all(col in df.columns for col in required_cols):
-                        existing_data = load_clients(clients_file)
-                        updated_data = pd.concat([existing_data, df], ignore_index=True)
-                        updated_data.to_csv(clients_file, index=False)
-                        st.cache_data.clear()
+                        # Append in the file's column order without reloading existing rows
+                        append_rows(df[required_cols], clients_file)
+                        load_clients.clear()
+                        client_status_summary.clear()
+                        paid_income_by_client.clear()
                         st.success(f"Successfully imported {len(df)} clients!")
                     else:
                         st.error(f"CSV must contain columns: {', '.join(required_cols)}")
@@ -809,10 +758,10 @@ def show_data_entry(transactions_file, clients_file, recurring_file):
                     # Validate required columns
                     required_cols = ['Vendor', 'Frequency', 'Amount', 'Due_Month']
                     if all(col in df.columns for col in required_cols):
-                        existing_data = load_recurring(recurring_file)
-                        updated_data = pd.concat([existing_data, df], ignore_index=True)
-                        updated_data.to_csv(recurring_file, index=False)
-                        st.cache_data.clear()
+                        # Append in the file's column order without reloading existing rows
+                        append_rows(df.reindex(columns=required_cols + ['Notes']), recurring_file)
+                        load_recurring.clear()
+                        recurring_by_frequency.clear()
                         st.success(f"Successfully imported {len(df)} recurring expenses!")
                     else:
                         st.error(f"CSV must contain columns: {', '.join(required_cols)}")
@@ -0,0 +1,179 @@
+import streamlit as st
+import pandas as pd
+import os
+import tempfile
+
+def file_mtime(file_path):
+    """Return the modification time of a data file, or None if it does not exist"""
+    return os.path.getmtime(file_path) if os.path.exists(file_path) else None
+
+@st.cache_resource(show_spinner=False)
+def init_data_files(transactions_file, clients_file, recurring_file):
+    """Create missing data files with their CSV headers"""
+    # cache_resource runs this bootstrap once per process and is not reset
+    # when the data caches are cleared after a write
+    headers = {
+        transactions_file: "Date,Type,Category,Amount,Description\n",
+        clients_file: "Client,Project,Amount,Invoice_Sent,Due_Date,Status\n",
+        recurring_file: "Vendor,Frequency,Amount,Due_Month,Notes\n",
+    }
+    for file_path, header in headers.items():
+        if not os.path.exists(file_path):
+            with open(file_path, 'w') as f:
+                f.write(header)
+
+# Parsed frames are also snapshotted to a Parquet file next to each CSV, so a
+# fresh process can skip CSV tokenizing and date parsing. The CSV stays the
+# source of truth: each snapshot records the (mtime_ns, size) of the CSV it was
+# parsed from and is only used while the CSV still matches exactly.
+# Bump SNAPSHOT_VERSION whenever a parse_* function changes the dtypes it returns.
+SNAPSHOT_VERSION = 3
+SNAPSHOT_SOURCE_KEY = b'financialdashboard.source'
+
+def snapshot_path(file_path):
+    """Path of the Parquet snapshot for a CSV data file"""
+    return f"{os.path.splitext(file_path)[0]}.v{SNAPSHOT_VERSION}.parquet"
+
+def source_fingerprint(file_path):
+    """Identify the exact version of a data file by its mtime and size"""
+    stat = os.stat(file_path)
+    return f"{stat.st_mtime_ns}:{stat.st_size}".encode()
+
+def write_snapshot(df, snapshot, source):
+    """Atomically write a Parquet snapshot tagged with its source fingerprint"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(snapshot) or '.', suffix='.parquet.tmp')
+    os.close(fd)
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), SNAPSHOT_SOURCE_KEY: source}
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_path)
+        os.replace(tmp_path, snapshot)
+    except (ImportError, OSError, ValueError, TypeError):
+        # Snapshots are an optimization only; keep serving the parsed CSV
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def read_with_snapshot(file_path, parse, columns=None):
+    """Read a CSV through its Parquet snapshot, refreshing the snapshot if stale"""
+    snapshot = snapshot_path(file_path)
+    # Fingerprint before parsing: if the CSV changes mid-parse, the snapshot is
+    # tagged with the older version and gets rebuilt on the next load
+    source = source_fingerprint(file_path)
+    if os.path.exists(snapshot):
+        try:
+            import pyarrow.parquet as pq
+            if (pq.read_schema(snapshot).metadata or {}).get(SNAPSHOT_SOURCE_KEY) == source:
+                return pd.read_parquet(snapshot, columns=columns)
+        except (ImportError, OSError, ValueError):
+            pass
+    
+    df = parse(file_path)
+    write_snapshot(df, snapshot, source)
+    return df if columns is None else df[columns]
+
+def parse_date_column(values):
+    """Parse a date column, using the fast ISO 8601 path for the common case"""
+    # Rows written by the app are ISO dates; only rows the ISO parser rejects
+    # (e.g. imported MM/DD/YYYY) fall back to per-row format inference
+    parsed = pd.to_datetime(values, format='ISO8601', errors='coerce')
+    failed = parsed.isna() & values.notna()
+    if failed.any():
+        parsed[failed] = pd.to_datetime(values[failed], format='mixed', errors='coerce')
+    return parsed
+
+# Column dtypes are passed to read_csv so the C parser emits them directly
+# instead of inferring and converting afterwards. Low-cardinality labels are
+# categoricals: comparisons and groupbys then work on integer codes.
+def parse_transactions(file_path):
+    """Parse the transactions CSV"""
+    columns = ['Date', 'Type', 'Category', 'Amount', 'Description']
+    df = pd.read_csv(
+        file_path,
+        usecols=lambda col: col in columns,
+        dtype={'Type': 'category', 'Category': 'category', 'Amount': 'float64'}
+    )
+    df['Date'] = parse_date_column(df['Date'])
+    return df
+
+def parse_clients(file_path):
+    """Parse the clients CSV"""
+    columns = ['Client', 'Project', 'Amount', 'Invoice_Sent', 'Due_Date', 'Status']
+    df = pd.read_csv(
+        file_path,
+        usecols=lambda col: col in columns,
+        dtype={'Status': 'category', 'Amount': 'float64'}
+    )
+    df['Invoice_Sent'] = parse_date_column(df['Invoice_Sent'])
+    df['Due_Date'] = parse_date_column(df['Due_Date'])
+    return df
+
+def parse_recurring(file_path):
+    """Parse the recurring expenses CSV"""
+    columns = ['Vendor', 'Frequency', 'Amount', 'Due_Month', 'Notes']
+    return pd.read_csv(
+        file_path,
+        usecols=lambda col: col in columns,
+        dtype={'Frequency': 'category', 'Due_Month': 'category', 'Amount': 'float64'}
+    )
+
+def load_transactions(file_path, columns=None):
+    """Load transactions data, optionally only the given columns"""
+    columns = columns or ['Date', 'Type', 'Category', 'Amount', 'Description']
+    try:
+        if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
+            # Return empty DataFrame with expected columns
+            return pd.DataFrame(columns=columns)
+            
+        return read_with_snapshot(file_path, parse_transactions, columns)
+    except (FileNotFoundError, pd.errors.EmptyDataError, pd.errors.ParserError, ValueError) as e:
+        st.warning(f"Error loading transactions data: {e}")
+        return pd.DataFrame(columns=columns)
+
+# Loaders are cached per (file_path, mtime) so page switches reuse the parsed
+# DataFrame and any write to the file invalidates the entry automatically.
+@st.cache_data(show_spinner=False)
+def load_transactions_slim(file_path, mtime=None):
+    """Load only the transaction columns the analytics pages aggregate"""
+    # Cache hits copy the whole cached frame, so the free-text Description
+    # column is never read into the cache at all
+    return load_transactions(file_path, ['Date', 'Type', 'Category', 'Amount'])
+
+@st.cache_data(show_spinner=False)
+def load_clients(file_path, mtime=None):
+    """Load clients data"""
+    try:
+        if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
+            # Return empty DataFrame with expected columns
+            return pd.DataFrame(columns=['Client', 'Project', 'Amount', 'Invoice_Sent', 'Due_Date', 'Status'])
+            
+        return read_with_snapshot(file_path, parse_clients)
+    except (FileNotFoundError, pd.errors.EmptyDataError, pd.errors.ParserError, ValueError) as e:
+        st.warning(f"Error loading clients data: {e}")
+        return pd.DataFrame(columns=['Client', 'Project', 'Amount', 'Invoice_Sent', 'Due_Date', 'Status'])
+
+@st.cache_data(show_spinner=False)
+def load_recurring(file_path, mtime=None):
+    """Load recurring expenses data"""
+    try:
+        if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
+            # Return empty DataFrame with expected columns
+            return pd.DataFrame(columns=['Vendor', 'Frequency', 'Amount', 'Due_Month', 'Notes'])
+            
+        return read_with_snapshot(file_path, parse_recurring)
+    except (FileNotFoundError, pd.errors.EmptyDataError, pd.errors.ParserError, ValueError) as e:
+        st.warning(f"Error loading recurring expenses data: {e}")
+        return pd.DataFrame(columns=['Vendor', 'Frequency', 'Amount', 'Due_Month', 'Notes'])
+
+def append_rows(df, file_path):
+    """Append rows to a data file, writing the header only if the file is new or empty"""
+    write_header = not os.path.exists(file_path) or os.path.getsize(file_path) == 0
+    if not write_header:
+        # A hand-edited file may lack its final newline; without one the first
+        # appended row would be glued onto the last existing record
+        with open(file_path, 'rb+') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+    df.to_csv(file_path, mode='a', header=write_header, index=False)
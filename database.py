@@ -1,12 +1,37 @@
 import sqlite3
 import hashlib
+import hmac
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 DATABASE_PATH = "finance_app.db"
 
+# scrypt parameters for password hashing; stored hashes are salt + derived key
+SALT_SIZE = 16
+SCRYPT_PARAMS = {"n": 2**14, "r": 8, "p": 1, "dklen": 32}
+# Salt for the throwaway derivation on failed lookups, so unknown usernames
+# cost as much to reject as wrong passwords
+DUMMY_SALT = bytes(SALT_SIZE)
+
+# Streamlit serves sessions from multiple threads, so the shared connection
+# is guarded by a lock
+_db_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def get_conn() -> sqlite3.Connection:
+    """Return the shared database connection, opening it on first use."""
+    conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
 def init_db():
     """Initialize the database with required tables"""
-    with sqlite3.connect(DATABASE_PATH) as conn:
+    with _db_lock, get_conn() as conn:
         cursor = conn.cursor()
         
         # Create users table
@@ -14,7 +39,7 @@ def init_db():
         CREATE TABLE IF NOT EXISTS users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             username TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
+            password_hash BLOB NOT NULL,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         ''')
@@ -24,49 +49,97 @@ def init_db():
         
         conn.commit()
 
-def hash_password(password: str) -> str:
-    """Hash a password for storing."""
-    return hashlib.sha256(password.encode()).hexdigest()
+def _derive_key(password: str, salt: bytes) -> bytes:
+    """Derive the scrypt key for a password and salt."""
+    return hashlib.scrypt(password.encode(), salt=salt, **SCRYPT_PARAMS)
+
+def hash_password(password: str, salt: Optional[bytes] = None) -> bytes:
+    """Hash a password for storing, using a fresh random salt unless one is given."""
+    if salt is None:
+        salt = os.urandom(SALT_SIZE)
+    return salt + _derive_key(password, salt)
+
+# Credentials that already verified, so repeat logins skip the key derivation.
+# Only successful checks are remembered: failed attempts (often near-misses of
+# the real password) are never kept in memory.
+VERIFIED_CACHE_SIZE = 128
+_verified = OrderedDict()
+_verified_lock = threading.Lock()
+
+def _check_password(password: str, stored_hash: bytes) -> bool:
+    """Check a password against a stored salt + scrypt key."""
+    key = (stored_hash, password)
+    with _verified_lock:
+        if key in _verified:
+            _verified.move_to_end(key)
+            return True
+    
+    if not hmac.compare_digest(stored_hash, hash_password(password, stored_hash[:SALT_SIZE])):
+        return False
+    with _verified_lock:
+        _verified[key] = True
+        if len(_verified) > VERIFIED_CACHE_SIZE:
+            _verified.popitem(last=False)
+    return True
 
 def create_user(username: str, password: str) -> bool:
     """Create a new user account."""
+    password_hash = hash_password(password)
     try:
-        with sqlite3.connect(DATABASE_PATH) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        with _db_lock, get_conn() as conn:
+            conn.execute(
                 'INSERT INTO users (username, password_hash) VALUES (?, ?)',
-                (username, hash_password(password))
+                (username, password_hash)
             )
             conn.commit()
-            
-            # Create user-specific data directory
-            user_dir = Path("user_data") / username
-            user_dir.mkdir(exist_ok=True)
-            
-            # Initialize user's data files
-            for file in ["transactions.csv", "clients.csv", "recurring.csv"]:
-                if not (user_dir / file).exists():
-                    (user_dir / file).touch()
-                    
-        return True
     except sqlite3.IntegrityError:
         return False
+    
+    # Create user-specific data directory once the account is committed,
+    # outside the lock so filesystem work does not hold up other sessions
+    user_dir = Path("user_data") / username
+    user_dir.mkdir(exist_ok=True)
+    
+    # Initialize user's data files
+    for file in ["transactions.csv", "clients.csv", "recurring.csv"]:
+        if not (user_dir / file).exists():
+            (user_dir / file).touch()
+            
+    return True
 
 def verify_user(username: str, password: str) -> bool:
     """Verify user credentials."""
-    with sqlite3.connect(DATABASE_PATH) as conn:
-        cursor = conn.cursor()
+    with _db_lock:
+        cursor = get_conn().cursor()
         cursor.execute(
             'SELECT password_hash FROM users WHERE username = ?',
             (username,)
         )
         result = cursor.fetchone()
+    
+    if result is None:
+        _derive_key(password, DUMMY_SALT)
+        return False
         
-        if result is None:
+    stored_hash = result[0]
+    if isinstance(stored_hash, str):
+        # Legacy unsalted SHA-256 hex digest: check it, then upgrade to scrypt
+        legacy_hash = hashlib.sha256(password.encode()).hexdigest()
+        if not hmac.compare_digest(stored_hash, legacy_hash):
+            _derive_key(password, DUMMY_SALT)
             return False
-            
-        stored_hash = result[0]
-        return stored_hash == hash_password(password)
+        # Derive the new hash before taking the lock for the UPDATE
+        new_hash = hash_password(password)
+        with _db_lock, get_conn() as conn:
+            conn.execute(
+                'UPDATE users SET password_hash = ? WHERE username = ?',
+                (new_hash, username)
+            )
+            conn.commit()
+        return True
+    
+    # Runs outside the lock so slow key derivation does not block other sessions
+    return _check_password(password, stored_hash)
 
 def get_user_data_path(username: str, filename: str) -> str:
     """Get the path to a user's data file."""
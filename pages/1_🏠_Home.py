@@ -1,60 +1,81 @@
 import streamlit as st
+from html import escape
+
+FEATURES = (
+    {"icon": "🔒", "title": "Secure", "desc": "Bank-level security for your data"},
+    {"icon": "📱", "title": "Accessible", "desc": "Use on any device, anywhere"},
+    {"icon": "📊", "title": "Insightful", "desc": "Powerful analytics and reports"},
+    {"icon": "🔄", "title": "Automated", "desc": "Save time with automation"},
+)
+
+KEY_FEATURES = (
+    "📊 Real-time financial overview",
+    "💰 Income and expense tracking",
+    "📈 Visual financial reports",
+    "🔄 Recurring payments management",
+    "📱 Access anywhere, anytime",
+)
+
+CARD_CSS = (
+    "<style>"
+    ".home-columns{display:grid;grid-template-columns:1fr 1fr;gap:1rem}"
+    ".feature-grid{display:grid;grid-template-columns:1fr;gap:0.5rem}"
+    ".feature-card{border:1px solid rgba(49,51,63,0.2);border-radius:0.5rem;padding:0.75rem 1rem}"
+    ".feature-card h4{margin:0 0 0.25rem 0;padding:0}"
+    ".feature-card small{opacity:0.7}"
+    "@media (max-width:640px){.home-columns{grid-template-columns:1fr}}"
+    "</style>"
+)
+
+# Bundled preview served by Streamlit static file serving (static/ next to app.py),
+# so the browser caches it and defers the fetch until it nears the viewport
+PREVIEW_IMAGE_HTML = (
+    '<img src="app/static/dashboard_preview.webp" loading="lazy" decoding="async" '
+    'width="100%" alt="Dashboard preview">'
+)
+
+def _home_static_html():
+    """Static part of the Home page as one markdown/HTML string"""
+    key_features = "".join(f"<li>{escape(feature)}</li>" for feature in KEY_FEATURES)
+    cards = "".join(
+        f'<div class="feature-card"><h4>{escape(f["icon"])} {escape(f["title"])}</h4>'
+        f'<small>{escape(f["desc"])}</small></div>'
+        for f in FEATURES
+    )
+    return "\n\n".join((
+        "# 💰 Welcome to Your Personal Financial Dashboard",
+        "Take control of your finances with our comprehensive financial management tool. "
+        "Track your income, expenses, and investments all in one place.",
+        f'{CARD_CSS}<div class="home-columns">'
+        f'<div><h3>Key Features</h3><ul>{key_features}</ul></div>'
+        f'<div><h3>Why Choose Us?</h3><div class="feature-grid">{cards}</div></div></div>',
+        "---",
+        "### See It In Action",
+        PREVIEW_IMAGE_HTML,
+        "*Screenshot of the dashboard interface*",
+        "---",
+        "### Get Started",
+    ))
+
+# Built at import: this script re-runs on every interaction, and building the
+# string costs about as much as a cache lookup would
+HOME_STATIC_HTML = _home_static_html()
 
 def show():
-    st.title("💰 Welcome to Your Personal Financial Dashboard")
-    
-    st.write("""
-    Take control of your finances with our comprehensive financial management tool. 
-    Track your income, expenses, and investments all in one place.
-    """)
+    st.markdown(HOME_STATIC_HTML, unsafe_allow_html=True)
     
+    # Only the buttons are built fresh on each rerun. Login and registration are
+    # routes of the main app, so hand over to app.py with the route preselected
+    # instead of rerunning this page first
     col1, col2 = st.columns(2)
-    
     with col1:
-        st.subheader("Key Features")
-        st.markdown("""
-        - 📊 Real-time financial overview
-        - 💰 Income and expense tracking
-        - 📈 Visual financial reports
-        - 🔄 Recurring payments management
-        - 📱 Access anywhere, anytime
-        """)
-        
-        st.markdown("---")
-        st.subheader("Get Started")
-        
-        # Center the buttons
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("🔑 Login to Your Account", use_container_width=True):
-                st.session_state.page = 'login'
-                st.rerun()
-        with col2:
-            if st.button("📝 Create New Account", type="primary", use_container_width=True):
-                st.session_state.page = 'register'
-                st.rerun()
-    
+        if st.button("🔑 Login to Your Account", use_container_width=True):
+            st.session_state.page = 'login'
+            st.switch_page("app.py")
     with col2:
-        st.subheader("Why Choose Us?")
-        
-        features = [
-            {"icon": "🔒", "title": "Secure", "desc": "Bank-level security for your data"},
-            {"icon": "📱", "title": "Accessible", "desc": "Use on any device, anywhere"},
-            {"icon": "📊", "title": "Insightful", "desc": "Powerful analytics and reports"},
-            {"icon": "🔄", "title": "Automated", "desc": "Save time with automation"}
-        ]
-        
-        for feature in features:
-            with st.container(border=True):
-                st.markdown(f"#### {feature['icon']} {feature['title']}")
-                st.caption(feature['desc'])
-    
-    st.markdown("---")
-    
-    # Add a demo section
-    st.subheader("See It In Action")
-    st.image("https://via.placeholder.com/800x400?text=Dashboard+Preview", use_container_width=True)
-    st.caption("*Screenshot of the dashboard interface*")
+        if st.button("📝 Create New Account", type="primary", use_container_width=True):
+            st.session_state.page = 'register'
+            st.switch_page("app.py")
 
 # This will be called from the main app
 if __name__ == "__main__":
@@ -1,82 +1,109 @@
+import re
 import streamlit as st
+from html import escape
+
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+FAQS = (
+    {
+        "question": "Is my financial data secure?",
+        "answer": "Yes, we use bank-level encryption and follow strict security protocols to protect your data."
+    },
+    {
+        "question": "Can I access my dashboard from multiple devices?",
+        "answer": "Absolutely! Your dashboard is accessible from any device with an internet connection."
+    },
+    {
+        "question": "How do I reset my password?",
+        "answer": "Click on 'Forgot Password' on the login page and follow the instructions sent to your email."
+    },
+    {
+        "question": "Is there a mobile app available?",
+        "answer": "Our web app is fully responsive and works on mobile browsers. We're also working on dedicated mobile apps."
+    },
+)
+
+CONTACT_INFO = (
+    {"label": "📍 Address", "lines": ("123 Finance Street", "New York, NY 10001", "United States")},
+    {"label": "📞 Phone", "lines": ("+1 (555) 123-4567",)},
+    {"label": "✉️ Email", "lines": ("support@financialdashboard.com",)},
+    {"label": "🕒 Business Hours", "lines": (
+        "Monday - Friday: 9:00 AM - 6:00 PM EST",
+        "Saturday: 10:00 AM - 4:00 PM EST",
+        "Sunday: Closed",
+    )},
+)
+
+CONTACT_CSS = (
+    "<style>"
+    ".contact-info{display:grid;grid-template-columns:repeat(auto-fit,minmax(12rem,1fr));gap:1rem}"
+    ".contact-info p{margin:0}"
+    ".faq details{border:1px solid rgba(49,51,63,0.2);border-radius:0.5rem;"
+    "padding:0.5rem 1rem;margin-bottom:0.5rem}"
+    ".faq summary{cursor:pointer}"
+    ".faq details p{margin:0.5rem 0 0 0}"
+    "</style>"
+)
+
+def _contact_static_html():
+    """Static part of the Contact page as one markdown/HTML string"""
+    info = "".join(
+        f'<p><strong>{escape(item["label"])}</strong><br>{"<br>".join(escape(line) for line in item["lines"])}</p>'
+        for item in CONTACT_INFO
+    )
+    # FAQs as native <details> blocks, opened and closed by the browser
+    faqs = "".join(
+        f"<details><summary>{escape(faq['question'])}</summary><p>{escape(faq['answer'])}</p></details>"
+        for faq in FAQS
+    )
+    return "\n\n".join((
+        "# 📞 Contact Us",
+        "We'd love to hear from you! Whether you have a question about features, need assistance, "
+        "or want to provide feedback, our team is here to help.",
+        "### Our Information",
+        f'{CONTACT_CSS}<div class="contact-info">{info}</div>',
+        "---",
+        "### Frequently Asked Questions",
+        f'<div class="faq">{faqs}</div>',
+        "---",
+        "### Get in Touch",
+    ))
+
+CONTACT_STATIC_HTML = _contact_static_html()
 
 def show():
-    st.title("📞 Contact Us")
-    
-    st.write("""
-    We'd love to hear from you! Whether you have a question about features, need assistance,
-    or want to provide feedback, our team is here to help.
-    """)
-    
-    col1, col2 = st.columns(2)
+    st.markdown(CONTACT_STATIC_HTML, unsafe_allow_html=True)
     
-    with col1:
-        st.subheader("Get in Touch")
+    # Only the form is built fresh on each rerun
+    with st.form("contact_form"):
+        name = st.text_input("Your Name")
+        email = st.text_input("Email Address")
+        subject = st.selectbox(
+            "Subject",
+            ["General Inquiry", "Technical Support", "Feature Request", "Feedback", "Other"]
+        )
+        message = st.text_area("Your Message", height=150)
         
-        with st.form("contact_form"):
-            name = st.text_input("Your Name")
-            email = st.text_input("Email Address")
-            subject = st.selectbox(
-                "Subject",
-                ["General Inquiry", "Technical Support", "Feature Request", "Feedback", "Other"]
-            )
-            message = st.text_area("Your Message", height=150)
-            
-            submitted = st.form_submit_button("Send Message")
-            if submitted:
-                if name and email and message:
-                    # In a real app, you would handle the form submission here
-                    st.success("Thank you for your message! We'll get back to you soon.")
-                else:
-                    st.warning("Please fill in all required fields.")
-    
-    with col2:
-        st.subheader("Our Information")
-        
-        st.markdown("""
-        **📍 Address**  
-        123 Finance Street  
-        New York, NY 10001  
-        United States
-        
-        **📞 Phone**  
-        +1 (555) 123-4567
-        
-        **✉️ Email**  
-        support@financialdashboard.com
-        
-        **🕒 Business Hours**  
-        Monday - Friday: 9:00 AM - 6:00 PM EST  
-        Saturday: 10:00 AM - 4:00 PM EST  
-        Sunday: Closed
-        """)
-    
-    st.markdown("---")
-    
-    st.subheader("Frequently Asked Questions")
-    
-    faqs = [
-        {
-            "question": "Is my financial data secure?",
-            "answer": "Yes, we use bank-level encryption and follow strict security protocols to protect your data."
-        },
-        {
-            "question": "Can I access my dashboard from multiple devices?",
-            "answer": "Absolutely! Your dashboard is accessible from any device with an internet connection."
-        },
-        {
-            "question": "How do I reset my password?",
-            "answer": "Click on 'Forgot Password' on the login page and follow the instructions sent to your email."
-        },
-        {
-            "question": "Is there a mobile app available?",
-            "answer": "Our web app is fully responsive and works on mobile browsers. We're also working on dedicated mobile apps."
-        }
-    ]
+        submitted = st.form_submit_button("Send Message")
+        if submitted:
+            # Record the outcome; it is shown once, below the form
+            if not all((name, email, message)):
+                st.session_state['contact_result'] = ('warning', "Please fill in all required fields.")
+            elif not EMAIL_RE.match(email):
+                st.session_state['contact_result'] = ('warning', "Please enter a valid email address.")
+            else:
+                # In a real app, you would handle the form submission here
+                st.session_state['contact_result'] = ('success', "Thank you for your message! We'll get back to you soon.")
     
-    for faq in faqs:
-        with st.expander(faq["question"]):
-            st.write(faq["answer"])
+    # Popped so the message belongs to the submission that produced it and
+    # does not reappear on later visits to this page
+    result = st.session_state.pop('contact_result', None)
+    if result:
+        level, text = result
+        if level == 'success':
+            st.success(text)
+        else:
+            st.warning(text)
 
 if __name__ == "__main__":
     show()
@@ -1,56 +1,63 @@
 import streamlit as st
+from html import escape
+
+TEAM = (
+    {"name": "John Doe", "role": "CEO & Founder", "bio": "Financial expert with 10+ years in fintech"},
+    {"name": "Jane Smith", "role": "Lead Developer", "bio": "Full-stack developer specializing in financial applications"},
+    {"name": "Alex Johnson", "role": "UX Designer", "bio": "Passionate about creating intuitive user experiences"},
+    {"name": "Sarah Williams", "role": "Financial Analyst", "bio": "Helping users make better financial decisions"},
+)
+
+VALUES = (
+    "🔍 Transparency in everything we do",
+    "🛡️ Security and privacy first",
+    "💡 Innovation for better financial health",
+    "🤝 Customer success is our success",
+)
+
+TEAM_CSS = (
+    "<style>"
+    ".team-grid{display:grid;grid-template-columns:1fr 1fr;gap:1rem}"
+    ".team-card{border:1px solid rgba(49,51,63,0.2);border-radius:0.5rem;padding:1rem}"
+    ".team-card h3{margin:0;padding:0}"
+    ".team-card .role{opacity:0.6;font-size:0.875rem;font-style:italic}"
+    ".team-card p{margin:0.5rem 0 0 0}"
+    "@media (max-width:640px){.team-grid{grid-template-columns:1fr}}"
+    "</style>"
+)
+
+def _about_static_html():
+    """Whole About page as one markdown/HTML string"""
+    cards = "".join(
+        f'<div class="team-card"><h3>{escape(m["name"])}</h3>'
+        f'<div class="role">{escape(m["role"])}</div><p>{escape(m["bio"])}</p></div>'
+        for m in TEAM
+    )
+    return "\n\n".join((
+        "# ℹ️ About Us",
+        "## Our Mission",
+        "At Financial Dashboard, we believe that everyone deserves financial clarity and control. "
+        "Our mission is to provide intuitive tools that help you understand and manage your personal "
+        "finances with confidence.",
+        "---",
+        "### Our Story",
+        "Founded in 2024, Financial Dashboard was born out of a simple idea: financial management "
+        "should be accessible, understandable, and empowering for everyone. Our team of financial "
+        "experts and tech enthusiasts came together to create a solution that makes personal "
+        "finance management both powerful and easy to use.",
+        "---",
+        "### Meet the Team",
+        f'{TEAM_CSS}<div class="team-grid">{cards}</div>',
+        "---",
+        "### Our Values",
+        "\n".join(f"- {value}" for value in VALUES),
+    ))
+
+ABOUT_STATIC_HTML = _about_static_html()
 
 def show():
-    st.title("ℹ️ About Us")
-    
-    st.write("""
-    ## Our Mission
-    At Financial Dashboard, we believe that everyone deserves financial clarity and control. 
-    Our mission is to provide intuitive tools that help you understand and manage your personal 
-    finances with confidence.
-    """)
-    
-    st.markdown("---")
-    
-    st.subheader("Our Story")
-    st.write("""
-    Founded in 2024, Financial Dashboard was born out of a simple idea: financial management 
-    should be accessible, understandable, and empowering for everyone. Our team of financial 
-    experts and tech enthusiasts came together to create a solution that makes personal 
-    finance management both powerful and easy to use.
-    """)
-    
-    st.markdown("---")
-    
-    st.subheader("Meet the Team")
-    
-    team = [
-        {"name": "John Doe", "role": "CEO & Founder", "bio": "Financial expert with 10+ years in fintech"},
-        {"name": "Jane Smith", "role": "Lead Developer", "bio": "Full-stack developer specializing in financial applications"},
-        {"name": "Alex Johnson", "role": "UX Designer", "bio": "Passionate about creating intuitive user experiences"},
-        {"name": "Sarah Williams", "role": "Financial Analyst", "bio": "Helping users make better financial decisions"}
-    ]
-    
-    cols = st.columns(2)
-    for idx, member in enumerate(team):
-        with cols[idx % 2]:
-            with st.container(border=True):
-                st.subheader(member["name"])
-                st.caption(f"_{member['role']}_")
-                st.write(member["bio"])
-    
-    st.markdown("---")
-    st.subheader("Our Values")
-    
-    values = [
-        "🔍 Transparency in everything we do",
-        "🛡️ Security and privacy first",
-        "💡 Innovation for better financial health",
-        "🤝 Customer success is our success"
-    ]
-    
-    for value in values:
-        st.write(f"- {value}")
+    # Nothing on this page is interactive, so it renders as a single element
+    st.markdown(ABOUT_STATIC_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     show()